@@ -1,3 +1,4 @@
+import sys
 from json import dumps
 from typing import Literal
 
@@ -75,7 +76,9 @@ def tasks(
     if json:
         print(dumps(to_jsonable_python(tasks, exclude_none=True), indent=2))
     else:
-        print("\n".join([f"{task.file}@{task.name}" for task in tasks]))
+        # stream lines rather than materializing one large joined string
+        sys.stdout.writelines(f"{task.file}@{task.name}\n" for task in tasks)
+        sys.stdout.flush()
 
 
 @list_command.command("logs", hidden=True)
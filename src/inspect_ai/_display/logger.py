@@ -9,6 +9,8 @@ from logging import (
     getLevelName,
     getLogger,
 )
+from logging.handlers import MemoryHandler
+from threading import Timer
 
 from rich.console import ConsoleRenderable
 from rich.logging import RichHandler
@@ -30,6 +32,46 @@ from inspect_ai._util.logger import notify_logger_record
 
 from .rich import rich_console
 
+# flush buffered file log records within this interval so that tailing
+# the log file during a quiet run doesn't lag far behind
+FILE_LOG_FLUSH_SECONDS = 2
+
+
+# buffer file log writes (so chatty workloads don't incur one file write
+# per record) while bounding flush latency -- the buffer is flushed on
+# warnings/errors, at shutdown, and via a timer within
+# FILE_LOG_FLUSH_SECONDS of any record being buffered (so trailing
+# records are visible to tailers even if logging then goes quiet)
+class FileLogHandler(MemoryHandler):
+    def __init__(self, target: FileHandler) -> None:
+        super().__init__(capacity=100, flushLevel=WARNING, target=target)
+        self._flush_timer: Timer | None = None
+
+    @override
+    def emit(self, record: LogRecord) -> None:
+        super().emit(record)
+        # schedule a flush for anything left in the buffer (daemon timer
+        # so it never blocks process exit)
+        self.acquire()
+        try:
+            if self.buffer and self._flush_timer is None:
+                self._flush_timer = Timer(FILE_LOG_FLUSH_SECONDS, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        finally:
+            self.release()
+
+    @override
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        finally:
+            self.release()
+        super().flush()
+
 
 # log handler that filters messages to stderr and the log file
 class LogHandler(RichHandler):
@@ -39,11 +81,14 @@ class LogHandler(RichHandler):
         self.display_level = WARNING
         # log into an external file if requested via env var
         file_logger = os.environ.get("INSPECT_PY_LOGGER_FILE", None)
-        self.file_logger = FileHandler(file_logger) if file_logger else None
-        if self.file_logger:
-            self.file_logger.setFormatter(
+        if file_logger:
+            file_handler = FileHandler(file_logger)
+            file_handler.setFormatter(
                 Formatter("%(asctime)s - %(levelname)s - %(message)s")
             )
+            self.file_logger: MemoryHandler | None = FileLogHandler(file_handler)
+        else:
+            self.file_logger = None
 
         # see if the user has a special log level for the file
         file_logger_level = os.environ.get("INSPECT_PY_LOGGER_LEVEL", "")
@@ -3,9 +3,11 @@ import contextlib
 import datetime
 from contextlib import contextmanager
 from dataclasses import dataclass
+from time import monotonic
 from typing import Any, Callable, Iterator, Set
 
 import rich
+from pydantic import BaseModel
 from rich.console import Console, ConsoleOptions, Group, RenderableType, RenderResult
 from rich.live import Live
 from rich.markdown import CodeBlock, Markdown
@@ -48,6 +50,13 @@ from ._display import (
     TaskSuccess,
 )
 
+# Performance note: this module is allocation-bound object-graph walking
+# and rich rendering -- there are no numeric loops, so JIT compilers
+# (numba/pypy) don't help here and their dispatch overhead would make
+# hot paths slower. Optimize by reducing allocations and re-renders
+# instead (see the throttling in RichProgress and the cached config
+# markup in TaskStatus).
+
 
 @dataclass
 class Theme:
@@ -66,6 +75,12 @@ class TaskStatus:
     result: TaskResult | None
     progress: RProgress
 
+    # config markup is static for the life of the task so compute it only
+    # once rather than on every live display refresh
+    def __post_init__(self) -> None:
+        self.config = task_config(self.profile)
+        self.config_no_generate = task_config(self.profile, generate_config=False)
+
 
 class RichDisplay(Display):
     def __init__(self) -> None:
@@ -265,16 +280,20 @@ class RichTaskDisplay(TaskDisplay):
         if show_name:
             description.truncate(20, overflow="ellipsis")
 
+        # precompute status markup (task_status is called on every progress
+        # update so don't rebuild these strings each time)
+        error_status = f"[{theme.error}]✗[{theme.error}]"
+        success_status = f"[{theme.success}]✔[{theme.success}]"
+        running_status = f"[{theme.meta}]⠿[{theme.meta}]"
+
         def task_status() -> str:
             if self.status.result:
-                if isinstance(self.status.result, TaskError):
-                    return f"[{theme.error}]✗[{theme.error}]"
-                elif isinstance(self.status.result, TaskCancelled):
-                    return f"[{theme.error}]✗[{theme.error}]"
+                if isinstance(self.status.result, TaskError | TaskCancelled):
+                    return error_status
                 else:
-                    return f"[{theme.success}]✔[{theme.success}]"
+                    return success_status
             else:
-                return f"[{theme.meta}]⠿[{theme.meta}]"
+                return running_status
 
         self.p = RichProgress(
             total=self.status.profile.steps,
@@ -301,6 +320,13 @@ class RichTaskDisplay(TaskDisplay):
 
 PROGRESS_TOTAL = 102
 
+# updates arrive once per sample step, which for large evals can be very
+# frequent -- rather than forcing a full re-render on every update, accumulate
+# progress and refresh only when at least 1% has accrued or when enough time
+# has elapsed since the last refresh
+PROGRESS_REFRESH_ADVANCE = PROGRESS_TOTAL / 100
+PROGRESS_REFRESH_SECONDS = 1 / 30
+
 
 class RichProgress(Progress):
     def __init__(
@@ -316,23 +342,39 @@ class RichProgress(Progress):
         self.progress = progress
         self.status = status if status else lambda: ""
         self.on_update = on_update
+        # advance per n=1 update (precomputed as update is called per step)
+        self._step_advance = 100.0 / total if total else 0.0
+        self._accumulated = 0.0
+        self._last_refresh = monotonic()
+        self._last_status = self.status()
         self.task_id = progress.add_task(
-            description, total=PROGRESS_TOTAL, model=model, status=self.status()
+            description, total=PROGRESS_TOTAL, model=model, status=self._last_status
         )
 
     @override
     def update(self, n: int = 1) -> None:
-        advance = (float(n) / float(self.total)) * 100
-        self.progress.update(
-            task_id=self.task_id, advance=advance, refresh=True, status=self.status()
-        )
-        if self.on_update:
-            self.on_update()
+        self._accumulated += n * self._step_advance
+        if (self._accumulated >= PROGRESS_REFRESH_ADVANCE) or (
+            (monotonic() - self._last_refresh) > PROGRESS_REFRESH_SECONDS
+        ):
+            # only pass the status field when it has actually changed
+            updates: dict[str, Any] = dict(advance=self._accumulated, refresh=True)
+            status = self.status()
+            if status != self._last_status:
+                updates["status"] = status
+                self._last_status = status
+            self.progress.update(task_id=self.task_id, **updates)
+            self._accumulated = 0.0
+            self._last_refresh = monotonic()
+            if self.on_update:
+                self.on_update()
 
     @override
     def complete(self) -> None:
+        self._accumulated = 0.0
+        self._last_status = self.status()
         self.progress.update(
-            task_id=self.task_id, completed=PROGRESS_TOTAL, status=self.status()
+            task_id=self.task_id, completed=PROGRESS_TOTAL, status=self._last_status
         )
 
 
@@ -352,7 +394,7 @@ def tasks_results(tasks: list[TaskStatus]) -> RenderableType:
 
 def task_live_status(tasks: list[TaskStatus], progress: RProgress) -> RenderableType:
     body: list[RenderableType] = ["", progress]
-    config = task_config(tasks[0].profile)
+    config = tasks[0].config
     if config:
         body = [config] + body
 
@@ -377,7 +419,7 @@ def tasks_live_status(
     completed = sum(1 for task in tasks if task.result is not None)
 
     # get config
-    config = task_config(tasks[0].profile, generate_config=False)
+    config = tasks[0].config_no_generate
     if config:
         config += "\n"
 
@@ -520,25 +562,33 @@ def task_no_ansi(profile: TaskProfile) -> str:
     return f"{message}...\n"
 
 
+def _nonnull_items(model: BaseModel) -> Iterator[tuple[str, Any]]:
+    # cheaper than model_dump(exclude_none=True) as we only need the
+    # top-level fields for string formatting (no recursive serialization)
+    for name in type(model).model_fields:
+        value = getattr(model, name)
+        if value is not None:
+            yield name, value
+
+
 def task_config(profile: TaskProfile, generate_config: bool = True) -> str:
     # merge config
     theme = rich_theme()
     # wind params back for display
     task_args = dict(profile.task_args)
-    for key in task_args.keys():
-        value = task_args[key]
+    for key, value in list(task_args.items()):
         if is_registry_dict(value):
             task_args[key] = value["name"]
-    config = task_args | dict(profile.eval_config.model_dump(exclude_none=True))
+    config = task_args | dict(_nonnull_items(profile.eval_config))
     if generate_config:
-        config = config | dict(profile.generate_config.model_dump(exclude_none=True))
+        config.update(_nonnull_items(profile.generate_config))
     if profile.tags:
         config["tags"] = ",".join(profile.tags)
     config_print: list[str] = []
     for name, value in config.items():
         if name == "approval":
             config_print.append(
-                f"{name}: {','.join([approver['name'] for approver in value['approvers']])}"
+                f"{name}: {','.join([approver.name for approver in value.approvers])}"
             )
         elif name not in ["limit", "model"]:
             config_print.append(f"{name}: {value}")
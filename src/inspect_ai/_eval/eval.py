@@ -3,8 +3,8 @@ import logging
 import os
 from pathlib import Path
 from typing import Any, Literal
+from uuid import uuid4
 
-from shortuuid import uuid
 from typing_extensions import Unpack
 
 from inspect_ai._cli.util import parse_cli_args
@@ -363,7 +363,7 @@ async def eval_async(
         # run tasks - 2 codepaths, one for the traditional task at a time
         # (w/ optional multiple models) and the other for true multi-task
         # (which requires different scheduling and UI)
-        run_id = uuid()
+        run_id = uuid4().hex
         task_definitions = len(resolved_tasks) // len(model)
         parallel = 1 if (task_definitions == 1 or max_tasks is None) else max_tasks
 
@@ -2,8 +2,8 @@ import asyncio
 import logging
 import os
 from typing import Any, Awaitable, Callable, Set, cast
+from uuid import uuid4
 
-from shortuuid import uuid
 from typing_extensions import Unpack
 
 from inspect_ai._display import display
@@ -149,7 +149,7 @@ async def eval_run(
                     task_name=task.name,
                     task_version=task.version,
                     task_file=resolved_task.task_file,
-                    task_id=resolved_task.id if resolved_task.id else uuid(),
+                    task_id=resolved_task.id if resolved_task.id else uuid4().hex,
                     run_id=run_id,
                     solver=eval_solver_spec,
                     tags=tags,
@@ -238,11 +238,10 @@ async def run_single(tasks: list[TaskRunOptions]) -> list[EvalLog]:
 # multiple mode -- run multiple logical tasks (requires some smart
 # schedluing to ensure that we are spreading work among models)
 async def run_multiple(tasks: list[TaskRunOptions], parallel: int) -> list[EvalLog]:
-    # track current usage of each model
-    models: Set[str] = set()
-    for task in tasks:
-        models.add(str(task.model))
-    model_counts = {model: 0 for model in models}
+    # track current usage of each model (cache each task's model string as
+    # the scheduler compares model strings repeatedly)
+    task_models = {id(task): str(task.model) for task in tasks}
+    model_counts = {model: 0 for model in set(task_models.values())}
 
     # setup pending tasks, queue, and results
     pending_tasks = tasks.copy()
@@ -255,10 +254,12 @@ async def run_multiple(tasks: list[TaskRunOptions], parallel: int) -> list[EvalL
         if tasks_completed < total_tasks:
             # find a task that keeps as many different models as possible running concurrently
             model = min(model_counts.items(), key=lambda m: m[1])[0]
-            next_task = next((t for t in pending_tasks if str(t.model) == model), None)
+            next_task = next(
+                (t for t in pending_tasks if task_models[id(t)] == model), None
+            )
             if next_task:
                 pending_tasks.remove(next_task)
-                model_counts[str(next_task.model)] += 1
+                model_counts[model] += 1
                 await queue.put(next_task)
                 return True
             else:
@@ -285,7 +286,7 @@ async def run_multiple(tasks: list[TaskRunOptions], parallel: int) -> list[EvalL
 
             # tracking
             tasks_completed += 1
-            model_counts[str(task_options.model)] -= 1
+            model_counts[task_models[id(task_options)]] -= 1
             queue.task_done()
 
             if result.status != "cancelled":
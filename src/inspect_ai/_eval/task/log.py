@@ -1,7 +1,6 @@
 from importlib import metadata as importlib_metadata
 from typing import Any, Literal, cast
-
-from shortuuid import uuid
+from uuid import uuid4
 
 from inspect_ai._eval.task.util import slice_dataset
 from inspect_ai._util.constants import (
@@ -91,7 +90,7 @@ class TaskLogger:
             run_id=run_id,
             created=iso_now(),
             task=f"{task_name}",
-            task_id=task_id if task_id else uuid(),
+            task_id=task_id if task_id else uuid4().hex,
             task_version=task_version,
             task_file=task_file,
             task_attribs=task_attribs,
@@ -418,7 +418,9 @@ async def task_run_sample(
         timeout(time_limit) if time_limit is not None else contextlib.nullcontext()
     )
 
-    # solver loop
+    # solver loop (resolve the sample's transcript once up front rather
+    # than re-reading the context var at each use below)
+    sample_transcript = transcript()
     async with semaphore_cm, sandboxenv_cm:
         error: EvalError | None = None
         try:
@@ -429,7 +431,7 @@ async def task_run_sample(
                     if sample.files
                     else None
                 )
-                transcript()._event(
+                sample_transcript._event(
                     SampleInitEvent(sample=event_sample, state=state_jsonable(state))
                 )
 
@@ -439,7 +441,7 @@ async def task_run_sample(
 
         except TimeoutError:
             # notify the user
-            transcript().info(
+            sample_transcript.info(
                 f"Sample completed: exceeded time limit ({time_limit:,} seconds)"
             )
 
@@ -455,7 +457,7 @@ async def task_run_sample(
             error = sample_error(ex)
 
             # fire error event
-            transcript()._event(ErrorEvent(error=error))
+            sample_transcript._event(ErrorEvent(error=error))
 
         # set timeout for scoring. if the original timeout was never hit
         # then just create a new timeout_cm targeting the original
@@ -480,7 +482,7 @@ async def task_run_sample(
                 if scorers and error is None:
                     for scorer in scorers:
                         scorer_name = unique_scorer_name(scorer, list(results.keys()))
-                        with transcript().step(name=scorer_name, type="scorer"):
+                        with sample_transcript.step(name=scorer_name, type="scorer"):
                             score_result = (
                                 await scorer(state, Target(sample.target))
                                 if scorer
@@ -494,7 +496,7 @@ async def task_run_sample(
                                     explanation=score_result.explanation,
                                     metadata=score_result.metadata,
                                 )
-                                transcript()._event(
+                                sample_transcript._event(
                                     ScoreEvent(score=score_result, target=sample.target)
                                 )
                                 results[scorer_name] = sample_score
@@ -506,7 +508,7 @@ async def task_run_sample(
         except BaseException as ex:
             # note timeout
             if isinstance(ex, TimeoutError):
-                transcript().info(
+                sample_transcript.info(
                     f"Unable to score sample due to exceeded time limit ({time_limit:,} seconds)"
                 )
 
@@ -514,7 +516,7 @@ async def task_run_sample(
             error = sample_error(ex)
 
             # fire error event
-            transcript()._event(ErrorEvent(error=error))
+            sample_transcript._event(ErrorEvent(error=error))
 
         progress()
 
@@ -667,18 +669,16 @@ def eval_log_sample_source(
         )
         return no_sample_source
     else:
+        # index samples by id/epoch ('previous' is called once per sample
+        # so a linear scan per lookup would be quadratic overall)
+        samples_by_id = {
+            (sample.id, sample.epoch): sample
+            for sample in (eval_log.samples or [])
+            if sample.error is None
+        }
 
         def previous(id: int | str, epoch: int) -> EvalSample | None:
-            return next(
-                (
-                    sample
-                    for sample in (eval_log.samples or [])
-                    if sample.id == id
-                    and sample.epoch == epoch
-                    and sample.error is None
-                ),
-                None,
-            )
+            return samples_by_id.get((id, epoch), None)
 
         return previous
 
@@ -9,12 +9,16 @@ JSONType = Literal["string", "integer", "number", "boolean", "array", "object",
 PythonType = Literal["str", "int", "float", "bool", "list", "dict", "None"]
 
 
+def _json_fallback(_x: Any) -> None:
+    return None
+
+
 def jsonable_python(x: Any) -> Any:
-    return to_jsonable_python(x, exclude_none=True, fallback=lambda _x: None)
+    return to_jsonable_python(x, exclude_none=True, fallback=_json_fallback)
 
 
 def jsonable_dict(x: Any) -> dict[str, JsonValue]:
-    x = to_jsonable_python(x, exclude_none=True, fallback=lambda _x: None)
+    x = to_jsonable_python(x, exclude_none=True, fallback=_json_fallback)
     if isinstance(x, dict):
         return x
     else:
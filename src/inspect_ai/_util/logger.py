@@ -26,7 +26,7 @@ def http_rate_limit_count() -> int:
 def warn_once(logger: Logger, message: str) -> None:
     if message not in _warned:
         logger.warning(message)
-        _warned.append(message)
+        _warned.add(message)
 
 
-_warned: list[str] = []
+_warned: set[str] = set()
@@ -1,5 +1,6 @@
 import importlib.util
 import os
+from functools import lru_cache
 
 from .error import set_exception_hook
 
@@ -41,10 +42,14 @@ def have_package(package: str) -> bool:
     return importlib.util.find_spec(package) is not None
 
 
+# these environment probes are constant for the life of the process and
+# are consulted on every display refresh, so cache them
+@lru_cache(maxsize=1)
 def is_running_in_jupyterlab() -> bool:
     return os.getenv("JPY_SESSION_NAME", None) is not None
 
 
+@lru_cache(maxsize=1)
 def is_running_in_vscode() -> bool:
     # Check if running in VS Code Jupyter notebook or interactive window
     if (
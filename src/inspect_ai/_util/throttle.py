@@ -1,19 +1,23 @@
-import time
 from functools import wraps
+from time import monotonic
 from typing import Any, Callable
 
 
 def throttle(seconds: int) -> Callable[..., Any]:
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        last_called: float = 0
+        # use the monotonic clock so throttling is immune to wall-clock
+        # adjustments (e.g. NTP sync) during long-running evals. note the
+        # monotonic clock has an arbitrary reference point (possibly near
+        # zero) so 'never called' needs an explicit sentinel
+        last_called: float | None = None
         last_result: Any = None
 
         @wraps(func)
         def wrapped(*args: Any, **kwargs: Any) -> Any:
             nonlocal last_called
             nonlocal last_result
-            current_time = time.time()
-            if current_time - last_called >= seconds:
+            current_time = monotonic()
+            if last_called is None or current_time - last_called >= seconds:
                 last_result = func(*args, **kwargs)
                 last_called = current_time
             return last_result
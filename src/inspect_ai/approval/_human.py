@@ -8,7 +8,12 @@ from rich.text import Text
 from inspect_ai.solver._task_state import TaskState
 from inspect_ai.tool._tool_call import ToolCall, ToolCallContent, ToolCallView
 from inspect_ai.util._console import input_screen
-from inspect_ai.util._trace import TracePanel, trace_enabled
+from inspect_ai.util._trace import (
+    TRACE_BLANK_LINE,
+    TRACE_CODE_THEME,
+    TracePanel,
+    trace_enabled,
+)
 
 from ._approval import Approval, ApprovalDecision
 from ._approver import Approver
@@ -41,29 +46,31 @@ def human_approver(
 
             def add_view_content(view_content: ToolCallContent) -> None:
                 if view_content.format == "markdown":
-                    renderables.append(Markdown(view_content.content))
+                    renderables.append(
+                        Markdown(view_content.content, code_theme=TRACE_CODE_THEME)
+                    )
                 else:
                     text_content = text_highlighter(Text(view_content.content))
                     renderables.append(text_content)
 
             # assistant content (don't add if trace_enabled as we already have it in that case)
             if message:
-                renderables.append(Text.from_markup("[bold]Assistant[/bold]\n"))
+                renderables.append(Text("Assistant\n", style="bold"))
                 renderables.append(Text(f"{message.strip()}"))
 
             # extra context provided by tool view
             if view.context:
-                renderables.append(Text())
+                renderables.append(TRACE_BLANK_LINE)
                 add_view_content(view.context)
-                renderables.append(Text())
+                renderables.append(TRACE_BLANK_LINE)
 
             # tool call view
             if view.call:
                 if message or view.context:
                     renderables.append(Rule("", style="bold", align="left"))
-                renderables.append(Text())
+                renderables.append(TRACE_BLANK_LINE)
                 add_view_content(view.call)
-                renderables.append(Text())
+                renderables.append(TRACE_BLANK_LINE)
 
             console.print(TracePanel(title="Approve Tool", content=renderables))
 
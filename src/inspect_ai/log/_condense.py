@@ -131,20 +131,10 @@ def walk_events(events: list[Event], content_fn: Callable[[str], str]) -> list[E
 
 
 def walk_event(event: Event, content_fn: Callable[[str], str]) -> Event:
-    if isinstance(event, SampleInitEvent):
-        return walk_sample_init_event(event, content_fn)
-    elif isinstance(event, ModelEvent):
-        return walk_model_event(event, content_fn)
-    elif isinstance(event, StateEvent):
-        return walk_state_event(event, content_fn)
-    elif isinstance(event, StoreEvent):
-        return walk_store_event(event, content_fn)
-    elif isinstance(event, SubtaskEvent):
-        return walk_subtask_event(event, content_fn)
-    elif isinstance(event, ToolEvent):
-        return walk_tool_event(event, content_fn)
-    else:
-        return event
+    # dispatch on exact type (Event is a closed union of pydantic models so
+    # a dict lookup replaces a chain of isinstance checks per event)
+    walker = _event_walkers.get(type(event))
+    return walker(event, content_fn) if walker else event
 
 
 def walk_subtask_event(
@@ -312,3 +302,12 @@ def mm3_hash(message: str) -> str:
 
     # Convert to unsigned integers and then to hexadecimal
     return f"{h1 & 0xFFFFFFFFFFFFFFFF:016x}{h2 & 0xFFFFFFFFFFFFFFFF:016x}"
+
+_event_walkers: dict[type, Callable[..., Event]] = {
+    SampleInitEvent: walk_sample_init_event,
+    ModelEvent: walk_model_event,
+    StateEvent: walk_state_event,
+    StoreEvent: walk_store_event,
+    SubtaskEvent: walk_subtask_event,
+    ToolEvent: walk_tool_event,
+}
@@ -21,6 +21,7 @@ class FileRecorder(Recorder):
         self.fs = filesystem(log_dir, fs_options)
         self.fs.mkdir(self.log_dir, exist_ok=True)
         self.suffix = suffix
+        self._log_file_keys: dict[tuple[str, str, str], str] = {}
 
     def is_local(self) -> bool:
         return self.fs.is_local()
@@ -58,15 +59,22 @@ class FileRecorder(Recorder):
             return eval_sample
 
     def _log_file_key(self, eval: EvalSpec) -> str:
-        # clean underscores, slashes, and : from the log file key (so we can reliably parse it
-        # later without worrying about underscores)
-        def clean(s: str) -> str:
-            return s.replace("_", "-").replace("/", "-").replace(":", "-")
+        # this is called once per logged sample so memoize the derived key
+        cache_key = (eval.created, eval.task, eval.task_id)
+        key = self._log_file_keys.get(cache_key)
+        if key is None:
 
-        # remove package from task name
-        task = registry_unqualified_name(eval.task)
+            # clean underscores, slashes, and : from the log file key (so we can reliably parse it
+            # later without worrying about underscores)
+            def clean(s: str) -> str:
+                return s.replace("_", "-").replace("/", "-").replace(":", "-")
 
-        return f"{clean(eval.created)}_{clean(task)}_{clean(eval.task_id)}"
+            # remove package from task name
+            task = registry_unqualified_name(eval.task)
+
+            key = f"{clean(eval.created)}_{clean(task)}_{clean(eval.task_id)}"
+            self._log_file_keys[cache_key] = key
+        return key
 
     def _log_file_path(self, eval: EvalSpec) -> str:
         return f"{self.log_dir}{self.fs.sep}{self._log_file_key(eval)}{self.suffix}"
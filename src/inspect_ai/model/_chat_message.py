@@ -36,10 +36,9 @@ class ChatMessageBase(BaseModel):
         if isinstance(self.content, str):
             return self.content
         else:
-            all_text = [
+            return "\n".join(
                 content.text for content in self.content if content.type == "text"
-            ]
-            return "\n".join(all_text)
+            )
 
     @text.setter
     def text(self, text: str) -> None:
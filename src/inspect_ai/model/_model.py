@@ -775,8 +775,7 @@ def sample_model_usage() -> dict[str, ModelUsage]:
 
 
 def sample_total_tokens() -> int:
-    total_tokens = [usage.total_tokens for usage in iter(sample_model_usage().values())]
-    return sum(total_tokens)
+    return sum(usage.total_tokens for usage in sample_model_usage().values())
 
 
 sample_model_usage_context_var: ContextVar[dict[str, ModelUsage]] = ContextVar(
@@ -567,12 +567,17 @@ def message_stop_reason(message: Message) -> StopReason:
 def split_system_messages(
     input: list[ChatMessage], config: GenerateConfig
 ) -> Tuple[list[ChatMessageSystem], list[ChatMessage]]:
-    # split messages
-    system_messages = [m for m in input if isinstance(m, ChatMessageSystem)]
-    messages = [m for m in input if not isinstance(m, ChatMessageSystem)]
+    # split messages (single pass rather than two filtering comprehensions)
+    system_messages: list[ChatMessageSystem] = []
+    messages: list[ChatMessage] = []
+    for m in input:
+        if isinstance(m, ChatMessageSystem):
+            system_messages.append(m)
+        else:
+            messages.append(m)
 
     # return
-    return system_messages, cast(list[ChatMessage], messages)
+    return system_messages, messages
 
 
 async def message_param_content(
@@ -1,6 +1,7 @@
 import json
 import os
 from copy import copy
+from operator import attrgetter
 from typing import Any
 
 from azure.ai.inference.aio import ChatCompletionsClient
@@ -345,7 +346,7 @@ def chat_completion_choices(
     choices: list[ChatChoice], tools: list[ToolInfo], handler: ChatAPIHandler | None
 ) -> list[ChatCompletionChoice]:
     choices = copy(choices)
-    choices.sort(key=lambda c: c.index)
+    choices.sort(key=attrgetter("index"))
     return [chat_complection_choice(choice, tools, handler) for choice in choices]
 
 
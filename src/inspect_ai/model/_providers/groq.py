@@ -1,5 +1,6 @@
 import json
 import os
+from operator import attrgetter
 from typing import Any, Dict, Iterable, List, Literal, Optional, cast
 
 from groq import (
@@ -169,7 +170,7 @@ class GroqAPI(ModelAPI):
         self, response: Any, tools: list[ToolInfo]
     ) -> List[ChatCompletionChoice]:
         choices = list(response.choices)
-        choices.sort(key=lambda c: c.index)
+        choices.sort(key=attrgetter("index"))
         return [
             ChatCompletionChoice(
                 message=chat_message_assistant(choice.message, tools),
@@ -1,5 +1,6 @@
 import json
 import os
+from operator import attrgetter
 from typing import Any, cast
 
 from openai import (
@@ -385,7 +386,7 @@ def chat_choices_from_response(
     response: ChatCompletion, tools: list[ToolInfo]
 ) -> list[ChatCompletionChoice]:
     choices = list(response.choices)
-    choices.sort(key=lambda c: c.index)
+    choices.sort(key=attrgetter("index"))
     return [
         ChatCompletionChoice(
             message=chat_message_assistant(choice.message, tools),
@@ -2,7 +2,9 @@ import json
 import re
 import textwrap
 from logging import getLogger
+from operator import attrgetter
 from typing import Any
+from uuid import uuid4
 
 from openai import AsyncOpenAI, BadRequestError
 from openai.types.chat import (
@@ -11,7 +13,6 @@ from openai.types.chat import (
     ChatCompletionMessageParam,
     ChatCompletionUserMessageParam,
 )
-from shortuuid import uuid
 from typing_extensions import override
 
 from inspect_ai.model import (
@@ -132,7 +133,7 @@ def chat_choices_from_response(
     response: ChatCompletion, tools: list[ToolInfo], handler: ChatAPIHandler
 ) -> list[ChatCompletionChoice]:
     choices = list(response.choices)
-    choices.sort(key=lambda c: c.index)
+    choices.sort(key=attrgetter("index"))
     return [
         # the assistant message might include a tool call so we call the
         # ChatAPIHandler to parse it and sort this out
@@ -308,7 +309,7 @@ def parse_tool_call_content(content: str, tools: list[ToolInfo]) -> ToolCall:
         # now perform the parse (we need to call thi function because it includes
         # the special handling to for mapping arguments that are a plain `str`
         # to the first parameter of the function)
-        unique_id = f"{name}_{uuid()}"
+        unique_id = f"{name}_{uuid4().hex}"
         return parse_tool_call(unique_id, name, json.dumps(arguments), tools)
 
     except Exception as ex:
@@ -1,5 +1,6 @@
 import os
 from json import dumps
+from operator import attrgetter
 from typing import Any
 
 import httpx
@@ -43,7 +44,7 @@ def chat_choices_from_response_together(
     response: ChatCompletion, tools: list[ToolInfo]
 ) -> list[ChatCompletionChoice]:
     choices = list(response.choices)
-    choices.sort(key=lambda c: c.index)
+    choices.sort(key=attrgetter("index"))
     logprobs_dicts = [
         choice.logprobs.model_dump() if choice.logprobs is not None else None
         for choice in choices
@@ -2,8 +2,8 @@ import json
 import re
 import textwrap
 from logging import getLogger
+from uuid import uuid4
 
-from shortuuid import uuid
 from typing_extensions import override
 
 from inspect_ai.tool._tool_call import ToolCall
@@ -169,7 +169,7 @@ def parse_tool_call_content(content: str, tools: list[ToolInfo]) -> ToolCall:
         # now perform the parse (we need to call thi function because it includes
         # the special handling to for mapping arguments that are a plain `str`
         # to the first parameter of the function)
-        unique_id = f"{name}_{uuid()}"
+        unique_id = f"{name}_{uuid4().hex}"
         return parse_tool_call(unique_id, name, json.dumps(arguments), tools)
 
     except Exception as ex:
@@ -1,5 +1,6 @@
 import json
 from copy import copy
+from operator import attrgetter
 from typing import Any, cast
 
 import vertexai  # type: ignore
@@ -198,9 +199,15 @@ def model_call_content(content: VertexContent) -> dict[str, Any]:
 
 
 async def as_chat_messages(messages: list[ChatMessage]) -> list[VertexContent]:
-    # google does not support system messages so filter them out to start with
-    system_messages = [message for message in messages if message.role == "system"]
-    supported_messages = [message for message in messages if message.role != "system"]
+    # google does not support system messages so filter them out to start
+    # with (single pass rather than two filtering comprehensions)
+    system_messages: list[ChatMessageSystem] = []
+    supported_messages: list[ChatMessageUser | ChatMessageAssistant | ChatMessageTool] = []
+    for message in messages:
+        if message.role == "system":
+            system_messages.append(message)
+        else:
+            supported_messages.append(message)
 
     # build google chat messages
     chat_messages: list[VertexContent] = [
@@ -343,7 +350,7 @@ def completion_choices_from_candidates(
     candidates: list[Candidate],
 ) -> list[ChatCompletionChoice]:
     candidates = copy(candidates)
-    candidates.sort(key=lambda c: c.index)
+    candidates.sort(key=attrgetter("index"))
     return [completion_choice_from_candidate(candidate) for candidate in candidates]
 
 
@@ -1,9 +1,16 @@
-from rich.console import RenderableType
+from rich import print
+from rich.console import Group, RenderableType
 from rich.markdown import Markdown
 from rich.text import Text
 
 from inspect_ai._util.format import format_function_call
-from inspect_ai.util._trace import trace_enabled, trace_panel
+from inspect_ai.util._trace import (
+    TRACE_BLANK_LINE,
+    TRACE_CODE_THEME,
+    TracePanel,
+    trace_enabled,
+    trace_panel,
+)
 
 from ._chat_message import ChatMessage, ChatMessageAssistant, ChatMessageTool
 
@@ -18,10 +25,11 @@ def trace_tool_mesage(message: ChatMessageTool) -> None:
         lines = output.splitlines()
         if len(lines) > MAX_LINES:
             content: list[RenderableType] = ["\n".join(lines[0:MAX_LINES])]
-            content.append(Text())
+            content.append(TRACE_BLANK_LINE)
             content.append(
-                Text.from_markup(
-                    f"[italic]Output truncated ({len(lines) - MAX_LINES} additional lines)...[/italic]"
+                Text(
+                    f"Output truncated ({len(lines) - MAX_LINES} additional lines)...",
+                    style="italic",
                 )
             )
         else:
@@ -44,11 +52,10 @@ def trace_assistant_message(
                 preceding.append(m)
             else:
                 break
+        renderables: list[RenderableType] = []
         for m in reversed(preceding):
-            trace_panel(
-                title=m.role.capitalize(),
-                content=m.text,
-            )
+            renderables.append(TracePanel(title=m.role.capitalize(), content=m.text))
+            renderables.append(TRACE_BLANK_LINE)
 
         # start with assistant content
         content: list[RenderableType] = [message.text] if message.text else []
@@ -56,13 +63,18 @@ def trace_assistant_message(
         # print tool calls
         if message.tool_calls:
             if content:
-                content.append(Text())
+                content.append(TRACE_BLANK_LINE)
             tool_calls: list[str] = []
             for call in message.tool_calls:
                 tool_calls.append(format_function_call(call.function, call.arguments))
             content.append(
-                Markdown("```python\n" + "\n\n".join(tool_calls) + "\n```\n"),
+                Markdown(
+                    "```python\n" + "\n\n".join(tool_calls) + "\n```\n",
+                    code_theme=TRACE_CODE_THEME,
+                ),
             )
 
-        # print the assistant message
-        trace_panel(title="Assistant", content=content)
+        # print the preceding messages and assistant message with a single
+        # console print (rather than one render/flush per panel)
+        renderables.append(TracePanel(title="Assistant", content=content))
+        print(Group(*renderables), TRACE_BLANK_LINE)
@@ -1,12 +1,10 @@
 from collections.abc import Sequence
 from contextvars import ContextVar
-from copy import deepcopy
 from dataclasses import dataclass
 from random import Random
 from typing import Any, Union, cast, overload
 
-from pydantic_core import to_jsonable_python
-
+from inspect_ai._util.json import jsonable_python
 from inspect_ai.dataset._dataset import Sample
 from inspect_ai.model import (
     ChatMessage,
@@ -344,7 +342,7 @@ def state_jsonable(state: TaskState | None = None) -> dict[str, Any]:
             return dict()
 
     def as_jsonable(value: Any) -> Any:
-        return to_jsonable_python(value, exclude_none=True, fallback=lambda _x: None)
+        return jsonable_python(value)
 
     state_data = dict(
         messages=as_jsonable(state.messages),
@@ -355,10 +353,12 @@ def state_jsonable(state: TaskState | None = None) -> dict[str, Any]:
         completed=state.completed,
         metadata=as_jsonable(state.metadata),
     )
+    # as_jsonable builds entirely fresh containers so no defensive copy
+    # is required
     jsonable = as_jsonable(state_data)
-    return cast(dict[str, Any], deepcopy(jsonable))
+    return cast(dict[str, Any], jsonable)
 
 
 def sample_jsonable(sample: Sample) -> dict[str, Any]:
-    jsonable = to_jsonable_python(sample, exclude_none=True, fallback=lambda _x: None)
-    return cast(dict[str, Any], deepcopy(jsonable))
+    jsonable = jsonable_python(sample)
+    return cast(dict[str, Any], jsonable)
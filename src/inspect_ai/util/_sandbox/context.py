@@ -1,8 +1,7 @@
 from contextvars import ContextVar
 from logging import getLogger
 from typing import Any, NoReturn, cast
-
-from shortuuid import uuid
+from uuid import uuid4
 
 from .environment import (
     SampleCleanup,
@@ -171,7 +170,7 @@ async def setup_sandbox_environment(
     env = default_sandbox_environment(environments)
 
     # copy to container
-    setup_file = f"/tmp/{uuid()}"
+    setup_file = f"/tmp/{uuid4().hex}"
     await env.write_file(setup_file, setup)
 
     # chmod, execute, and remove
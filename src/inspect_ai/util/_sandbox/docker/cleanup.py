@@ -13,14 +13,14 @@ from .util import ComposeProject
 
 
 def project_cleanup_startup() -> None:
-    _running_projects.set([])
+    _running_projects.set({})
     _auto_compose_files.set(set())
     _cleanup_completed.set(False)
 
 
 def project_startup(project: ComposeProject) -> None:
     # track running projects
-    running_projects().append(project)
+    _running_projects.get()[project.name] = project
 
     # track auto compose we need to cleanup
     if project.config and is_auto_compose_file(project.config):
@@ -31,16 +31,16 @@ async def project_cleanup(project: ComposeProject, quiet: bool = True) -> None:
     # bring down services
     await compose_down(project=project, quiet=quiet)
 
-    # remove the project from the list of running projects
-    if project in running_projects():
-        running_projects().remove(project)
+    # remove the project from the running projects (keyed by name so
+    # no equality scan over the list is required)
+    _running_projects.get().pop(project.name, None)
 
 
 async def project_cleanup_shutdown(cleanup: bool) -> None:
     # cleanup is global so we do it only once
     if not _cleanup_completed.get():
         # get projects that still need shutting down
-        shutdown_projects = running_projects().copy()
+        shutdown_projects = running_projects()
 
         # full cleanup if requested
         if len(shutdown_projects) > 0:
@@ -128,14 +128,14 @@ async def cli_cleanup(project_name: str | None) -> None:
 
 
 def running_projects() -> list[ComposeProject]:
-    return _running_projects.get()
+    return list(_running_projects.get().values())
 
 
 def auto_compose_files() -> Set[str]:
     return _auto_compose_files.get()
 
 
-_running_projects: ContextVar[list[ComposeProject]] = ContextVar(
+_running_projects: ContextVar[dict[str, ComposeProject]] = ContextVar(
     "docker_running_projects"
 )
 
@@ -2,8 +2,7 @@ import re
 from dataclasses import dataclass
 from logging import getLogger
 from pathlib import Path
-
-from shortuuid import uuid
+from uuid import uuid4
 
 from inspect_ai._util.constants import SANDBOX
 
@@ -78,10 +77,13 @@ def task_project_name(task: str) -> str:
     if len(task) == 0:
         task = "task"
 
-    return f"inspect-{task}-i{uuid().lower()}"
+    return f"inspect-{task}-i{uuid4().hex}"
 
 
-inspect_project_pattern = r"^inspect-[a-z\d\-_]*-i[a-z\d]{22}$"
+# match the uuid4().hex suffix generated above (32 hex chars) as well as
+# the 22-char shortuuid suffix generated by previous versions (so that
+# cleanup still recognizes projects created before an upgrade)
+inspect_project_pattern = r"^inspect-[a-z\d\-_]*-i([a-z\d]{22}|[a-z\d]{32})$"
 
 
 def is_inspect_project(name: str) -> bool:
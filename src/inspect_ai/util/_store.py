@@ -1,5 +1,4 @@
 from contextvars import ContextVar
-from copy import deepcopy
 from typing import (
     Any,
     ItemsView,
@@ -10,9 +9,7 @@ from typing import (
     overload,
 )
 
-from pydantic_core import to_jsonable_python
-
-from inspect_ai._util.json import JsonChange, json_changes
+from inspect_ai._util.json import JsonChange, json_changes, jsonable_python
 
 VT = TypeVar("VT")
 
@@ -124,11 +121,10 @@ def store_changes(
 
 
 def store_jsonable(store: Store) -> dict[str, Any]:
-    return deepcopy(dict_jsonable(store._data))
+    # to_jsonable_python builds entirely fresh containers so no defensive
+    # copy is required (this snapshot runs before/after every step)
+    return dict_jsonable(store._data)
 
 
 def dict_jsonable(data: dict[str, Any]) -> dict[str, Any]:
-    return cast(
-        dict[str, Any],
-        to_jsonable_python(data, exclude_none=True, fallback=lambda _x: None),
-    )
+    return cast(dict[str, Any], jsonable_python(data))
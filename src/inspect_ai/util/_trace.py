@@ -6,6 +6,14 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.text import Text
 
+# use vs theme for markdown code in trace panels (callers rendering
+# markdown should pass this to the Markdown constructor)
+TRACE_CODE_THEME = "xcode"
+
+# shared blank-line spacer (rich doesn't mutate renderables during
+# render so a single instance can be re-used everywhere)
+TRACE_BLANK_LINE = Text()
+
 
 def trace_enabled() -> bool:
     """Is trace mode currently enabled."""
@@ -30,7 +38,7 @@ def trace_panel(
     """
     print(
         TracePanel(title, subtitle, content),
-        Text(),
+        TRACE_BLANK_LINE,
     )
 
 
@@ -44,15 +52,16 @@ class TracePanel(Panel):
         # resolve content to list
         content = content if isinstance(content, list) else [content]
 
-        # inject subtitle
-        if subtitle:
-            content.insert(0, Text())
-            content.insert(0, Text.from_markup(f"[bold]{subtitle}[/bold]"))
-
-        # use vs theme for markdown code
+        # ensure the code theme for markdown content from callers that
+        # didn't pass it to the Markdown constructor themselves
         for c in content:
             if isinstance(c, Markdown):
-                c.code_theme = "xcode"
+                c.code_theme = TRACE_CODE_THEME
+
+        # inject subtitle
+        if subtitle:
+            content.insert(0, TRACE_BLANK_LINE)
+            content.insert(0, Text(subtitle, style="bold"))
 
         super().__init__(
             Group(*content),
@@ -0,0 +1,75 @@
+from time import monotonic
+from typing import Any
+
+import pytest
+
+from inspect_ai._display.rich import (
+    PROGRESS_TOTAL,
+    RichProgress,
+)
+
+
+class StubProgress:
+    """Stands in for rich.progress.Progress, recording update calls."""
+
+    def __init__(self) -> None:
+        self.updates: list[dict[str, Any]] = []
+
+    def add_task(self, description: str, **kwargs: Any) -> int:
+        return 0
+
+    def update(self, task_id: int, **kwargs: Any) -> None:
+        self.updates.append(kwargs)
+
+
+def rich_progress(total: int, **kwargs: Any) -> tuple[RichProgress, StubProgress]:
+    stub = StubProgress()
+    progress = RichProgress(total=total, progress=stub, **kwargs)  # type: ignore[arg-type]
+    return progress, stub
+
+
+def test_rich_progress_throttles_refresh():
+    progress, stub = rich_progress(total=1000)
+    # suppress the time-based gate so only the advance gate applies
+    progress._last_refresh = monotonic()
+    for _ in range(0, 10):
+        progress.update()
+    # 10 steps of 1000 is < 1% so no refresh should have occurred
+    assert stub.updates == []
+
+
+def test_rich_progress_flushes_accumulated_advance():
+    progress, stub = rich_progress(total=100)
+    progress._last_refresh = monotonic()
+    progress.update(2)
+    # crossed the 1% advance gate: accumulated advance delivered in one update
+    assert len(stub.updates) == 1
+    assert stub.updates[0]["advance"] == pytest.approx(2.0)
+
+
+def test_rich_progress_refreshes_after_interval():
+    progress, stub = rich_progress(total=1000)
+    # simulate the refresh interval having elapsed
+    progress._last_refresh = monotonic() - 1
+    progress.update()
+    assert len(stub.updates) == 1
+    assert stub.updates[0]["advance"] == pytest.approx(0.1)
+
+
+def test_rich_progress_zero_total():
+    progress, stub = rich_progress(total=0)
+    progress.update()
+    progress.complete()
+    assert stub.updates[-1]["completed"] == PROGRESS_TOTAL
+
+
+def test_rich_progress_status_only_when_changed():
+    status = "status 1"
+    progress, stub = rich_progress(total=100, status=lambda: status)
+    progress._last_refresh = monotonic()
+    progress.update(2)
+    # status unchanged so it should not have been passed
+    assert "status" not in stub.updates[0]
+    status = "status 2"
+    progress.update(2)
+    assert stub.updates[1]["status"] == "status 2"
@@ -0,0 +1,29 @@
+from inspect_ai._util.throttle import throttle
+
+
+def test_throttle_first_call_invokes():
+    calls: list[int] = []
+
+    @throttle(60)
+    def counter() -> int:
+        calls.append(1)
+        return len(calls)
+
+    # first call always invokes the wrapped function
+    assert counter() == 1
+    assert len(calls) == 1
+
+
+def test_throttle_returns_cached_result_within_window():
+    calls: list[int] = []
+
+    @throttle(60)
+    def counter() -> int:
+        calls.append(1)
+        return len(calls)
+
+    assert counter() == 1
+    # within the window: cached result, no additional invocation
+    assert counter() == 1
+    assert counter() == 1
+    assert len(calls) == 1